@@ -5,21 +5,107 @@ Aplikasi Quantum Computing Canggih dengan Multiple Algorithms
 
 import numpy as np # type: ignore
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile # type: ignore
+from qiskit.circuit import Gate # type: ignore
 from qiskit_aer import AerSimulator # type: ignore
-from qiskit.visualization import plot_histogram, plot_bloch_multivector, circuit_drawer # type: ignore
-from qiskit.quantum_info import Statevector, DensityMatrix, entropy # type: ignore
-from qiskit.circuit.library import QFT, GroverOperator # type: ignore
-import matplotlib.pyplot as plt # type: ignore
-from typing import List, Dict, Tuple
+from qiskit.quantum_info import Statevector, entropy, partial_trace # type: ignore
+from qiskit.circuit.library import grover_operator, get_standard_gate_name_mapping # type: ignore
+from qiskit.synthesis.qft import synth_qft_full # type: ignore
+from typing import List, Dict, Tuple, Optional
+from collections import OrderedDict
+import os
 import time
+import weakref
+
+# Batas jumlah circuit hasil transpile yang disimpan di cache (LRU)
+TRANSPILE_CACHE_SIZE = 128
+
+# Batas total memori (byte) statevector yang disimpan untuk resampling (LRU)
+STATEVECTOR_CACHE_BYTES = 256 * 1024 * 1024
+
+# Jumlah qubit maksimum agar hasil diambil dengan resampling statevector
+RESAMPLE_MAX_QUBITS = 20
+
+# Batas jumlah diagram teks circuit yang disimpan di cache (LRU)
+DIAGRAM_CACHE_SIZE = 32
+
+# Gate standar Qiskit: cukup dikenali lewat nama + parameter (tanpa definisi)
+STANDARD_GATE_NAMES = frozenset(get_standard_gate_name_mapping()) | {'barrier'}
+
+# Gate yang bisa langsung dieksekusi AerSimulator tanpa transpile
+AER_NATIVE_GATES = frozenset({
+    'h', 'x', 'cx', 'cz', 'cp', 'ry', 'ccx', 'swap', 'measure', 'barrier',
+    'save_statevector'
+})
+
+# Gate Clifford: circuit yang hanya memakai gate ini disimulasikan dengan metode stabilizer
+CLIFFORD_GATES = frozenset({
+    'h', 'x', 'y', 'z', 's', 'sdg', 'cx', 'cx_o0', 'cz', 'swap', 'measure', 'barrier'
+})
+
+# Basis gate yang dipetakan satu-satu ke kernel CUDA-Q
+CUDAQ_BASIS_GATES = (
+    'h', 'x', 'y', 'z', 's', 't', 'rx', 'ry', 'rz', 'cx', 'cz', 'cp', 'ccx', 'swap'
+)
+
+# Opsi paralelisme dan gate fusion AerSimulator
+N_CPUS = os.cpu_count() or 1
+SIMULATOR_OPTIONS = {
+    'max_parallel_threads': N_CPUS,
+    'max_parallel_experiments': N_CPUS,
+    'statevector_parallel_threshold': 8,
+    'fusion_enable': True,
+    'fusion_threshold': 5,
+}
+
+# Jumlah qubit minimum agar circuit otomatis dijalankan di GPU (jika tersedia)
+GPU_QUBIT_THRESHOLD = 10
 
 class AdvancedQuantumApp:
     """Aplikasi Quantum Computing dengan berbagai algoritma canggih"""
     
-    def __init__(self):
-        self.simulator = AerSimulator()
+    # Cache gate QFT per (n_qubits, inverse, do_swaps), dipakai bersama semua instance
+    _qft_cache: Dict[Tuple[int, bool, bool], Gate] = {}
+    
+    def __init__(self, use_gpu: bool = False):
+        self.simulator = AerSimulator(method='statevector', **SIMULATOR_OPTIONS)
+        self.stabilizer_simulator = AerSimulator(method='stabilizer', **SIMULATOR_OPTIONS)
+        self.use_gpu = use_gpu
+        self.gpu_simulator = None
+        if 'GPU' in self.simulator.available_devices():
+            self.gpu_simulator = AerSimulator(method='statevector', device='GPU',
+                                              cuStateVec_enable=True, **SIMULATOR_OPTIONS)
         self.results_history = []
-        
+        self._transpile_cache: OrderedDict[Tuple, QuantumCircuit] = OrderedDict()
+        self._diagram_cache: OrderedDict[int, Tuple[weakref.ref, int, str]] = OrderedDict()
+        self._statevector_cache: OrderedDict[Tuple, Statevector] = OrderedDict()
+        self._statevector_cache_bytes = 0
+        self._rng = np.random.default_rng()
+        self._warm_up()
+        
+    def _warm_up(self):
+        """Jalankan circuit kecil agar thread pool OpenMP Aer sudah siap"""
+        qc = QuantumCircuit(1, 1)
+        qc.h(0)
+        qc.measure(0, 0)
+        self.simulator.run(qc, shots=1).result()
+    
+    @staticmethod
+    def _reserve_instructions(qc: QuantumCircuit, n_ops: int):
+        """Alokasikan kapasitas instruksi di awal (CircuitData Rust, Qiskit >= 1.0)"""
+        reserve = getattr(qc._data, 'reserve', None)
+        if reserve is not None:
+            reserve(n_ops)
+    
+    @classmethod
+    def _get_qft(cls, n_qubits: int, inverse: bool = False, do_swaps: bool = True) -> Gate:
+        """Gate QFT hasil sintesis (H + CP + SWAP), dibangun sekali per konfigurasi"""
+        key = (n_qubits, inverse, do_swaps)
+        if key not in cls._qft_cache:
+            qft = synth_qft_full(n_qubits, do_swaps=do_swaps, inverse=inverse,
+                                 name='IQFT' if inverse else 'QFT')
+            cls._qft_cache[key] = qft.to_gate()
+        return cls._qft_cache[key]
+    
     def create_superposition(self, n_qubits: int) -> QuantumCircuit:
         """Membuat superposisi quantum untuk n qubits"""
         qc = QuantumCircuit(n_qubits)
@@ -33,12 +119,11 @@ class AdvancedQuantumApp:
         """
         qc = QuantumCircuit(n_pairs * 2, n_pairs * 2)
         
-        for i in range(n_pairs):
-           
-            qc.h(i * 2)
-            
-            qc.cx(i * 2, i * 2 + 1)
-            
+        # Satu panggilan per jenis gate: H pada qubit genap, CX genap -> ganjil
+        if n_pairs > 0:
+            qc.h(range(0, n_pairs * 2, 2))
+            qc.cx(range(0, n_pairs * 2, 2), range(1, n_pairs * 2, 2))
+        
         qc.barrier()
         qc.measure(range(n_pairs * 2), range(n_pairs * 2))
         
@@ -68,9 +153,11 @@ class AdvancedQuantumApp:
         qc.measure([0, 1], [0, 1])
         qc.barrier()
         
-       
-        qc.cx(1, 2)
-        qc.cz(0, 2)
+        # Koreksi klasik: X jika bit 1 bernilai 1, Z jika bit 0 bernilai 1
+        with qc.if_test((qc.clbits[1], 1)):
+            qc.x(2)
+        with qc.if_test((qc.clbits[0], 1)):
+            qc.z(2)
         qc.measure(2, 2)
         
         return qc
@@ -82,38 +169,29 @@ class AdvancedQuantumApp:
         """
         qc = QuantumCircuit(n_qubits, n_qubits)
         
+        # H + (gate Grover + barrier) per iterasi + measurement
+        iterations = int(np.pi / 4 * np.sqrt(2 ** n_qubits))
+        self._reserve_instructions(qc, 2 * n_qubits + 2 * iterations)
       
         qc.h(range(n_qubits))
         
-       
-        def oracle(circuit, target_bits):
-           
-            for i, bit in enumerate(target_bits):
-                if bit == '0':
-                    circuit.x(i)
-            circuit.h(n_qubits - 1)
-            circuit.mcx(list(range(n_qubits - 1)), n_qubits - 1)
-            circuit.h(n_qubits - 1)
-            for i, bit in enumerate(target_bits):
-                if bit == '0':
-                    circuit.x(i)
-        
-       
-        def diffusion(circuit, n):
-            circuit.h(range(n))
-            circuit.x(range(n))
-            circuit.h(n - 1)
-            circuit.mcx(list(range(n - 1)), n - 1)
-            circuit.h(n - 1)
-            circuit.x(range(n))
-            circuit.h(range(n))
-        
+        # Oracle: phase flip pada state target
+        oracle = QuantumCircuit(n_qubits)
+        for i, bit in enumerate(target):
+            if bit == '0':
+                oracle.x(i)
+        oracle.h(n_qubits - 1)
+        oracle.mcx(list(range(n_qubits - 1)), n_qubits - 1)
+        oracle.h(n_qubits - 1)
+        for i, bit in enumerate(target):
+            if bit == '0':
+                oracle.x(i)
+        
+        # Operator Grover (oracle + diffusion) dibangun sekali lalu dipakai ulang
+        grover_gate = grover_operator(oracle).to_gate()
         
-        iterations = int(np.pi / 4 * np.sqrt(2 ** n_qubits))
         for _ in range(iterations):
-            oracle(qc, target)
-            qc.barrier()
-            diffusion(qc, n_qubits)
+            qc.append(grover_gate, range(n_qubits))
             qc.barrier()
         
         qc.measure(range(n_qubits), range(n_qubits))
@@ -131,7 +209,7 @@ class AdvancedQuantumApp:
         qc.barrier()
         
       
-        qc.append(QFT(n_qubits, do_swaps=False), range(n_qubits))
+        qc.append(self._get_qft(n_qubits, do_swaps=False), range(n_qubits))
         
        
         for i in range(n_qubits // 2):
@@ -149,6 +227,7 @@ class AdvancedQuantumApp:
         """
         n_qubits = n_counting_qubits + 1
         qc = QuantumCircuit(n_qubits, n_counting_qubits)
+        self._reserve_instructions(qc, 3 * n_counting_qubits + 4)
         
        
         qc.x(n_counting_qubits)
@@ -158,14 +237,14 @@ class AdvancedQuantumApp:
         qc.barrier()
         
       
+        # 2^i gate CP(π/4) berturut-turut sama dengan satu CP(π/4 · 2^i)
         for i in range(n_counting_qubits):
-            for _ in range(2 ** i):
-                qc.cp(np.pi / 4, i, n_counting_qubits)
+            qc.cp((np.pi / 4) * (1 << i), i, n_counting_qubits)
         
         qc.barrier()
         
        
-        qc.append(QFT(n_counting_qubits, inverse=True), range(n_counting_qubits))
+        qc.append(self._get_qft(n_counting_qubits, inverse=True), range(n_counting_qubits))
         
         qc.measure(range(n_counting_qubits), range(n_counting_qubits))
         
@@ -215,10 +294,9 @@ class AdvancedQuantumApp:
             qc.barrier()
             
            
+            # Open control (ctrl_state=0) menggantikan pasangan X di sekitar CX
             qc.cx(0, 1)
-            qc.x(0)
-            qc.cx(0, 2)
-            qc.x(0)
+            qc.cx(0, 2, ctrl_state=0)
             qc.barrier()
         
         qc.measure(range(1, n_qubits), range(position_qubits))
@@ -254,14 +332,224 @@ class AdvancedQuantumApp:
         
         return qc
     
+    def _select_simulator(self, circuit: QuantumCircuit) -> AerSimulator:
+        """
+        Pilih backend: stabilizer untuk circuit Clifford, GPU (cuStateVec)
+        untuk circuit besar, selain itu statevector CPU
+        """
+        if CLIFFORD_GATES.issuperset(circuit.count_ops()):
+            return self.stabilizer_simulator
+        if self.gpu_simulator is not None and (
+                self.use_gpu or circuit.num_qubits >= GPU_QUBIT_THRESHOLD):
+            return self.gpu_simulator
+        return self.simulator
+    
+    @classmethod
+    def _circuit_key(cls, circuit: QuantumCircuit,
+                     _memo: Optional[Dict[int, Tuple]] = None) -> Tuple:
+        """
+        Key cache berdasarkan isi circuit: register, lalu nama, parameter, dan
+        indeks qubit/clbit setiap instruksi. Gate kustom (mis. Grover, QFT)
+        ikut dibandingkan lewat definisinya; definisi gate yang sama (objek
+        yang sama) hanya ditelusuri sekali per perhitungan key
+        """
+        if _memo is None:
+            _memo = {}
+        
+        def param_key(param):
+            if isinstance(param, QuantumCircuit):
+                return cls._circuit_key(param, _memo)
+            if isinstance(param, np.ndarray):
+                return (param.shape, param.tobytes())
+            try:
+                return float(param)
+            except (TypeError, ValueError):
+                return repr(param)
+        
+        def operation_key(operation):
+            if operation.name in STANDARD_GATE_NAMES:
+                return (operation.name, tuple(param_key(p) for p in operation.params))
+            
+            # Objek operation tetap hidup selama perhitungan key, jadi id() aman dipakai
+            memo_key = id(operation)
+            if memo_key not in _memo:
+                base_gate = getattr(operation, 'base_gate', None)
+                if base_gate is not None and base_gate.name in STANDARD_GATE_NAMES:
+                    # Gate terkontrol (mcx, cx_o0, ...) ditentukan oleh base gate + kontrol
+                    body = (operation_key(base_gate), operation.num_ctrl_qubits,
+                            operation.ctrl_state)
+                elif operation.definition is not None:
+                    body = cls._circuit_key(operation.definition, _memo)
+                else:
+                    body = None
+                _memo[memo_key] = (
+                    operation.name,
+                    operation.num_qubits,
+                    tuple(param_key(p) for p in operation.params),
+                    repr(getattr(operation, 'condition', None)),
+                    body,
+                )
+            return _memo[memo_key]
+        
+        qubit_index = {bit: i for i, bit in enumerate(circuit.qubits)}
+        clbit_index = {bit: i for i, bit in enumerate(circuit.clbits)}
+        instructions = tuple(
+            (
+                operation_key(instruction.operation),
+                tuple(qubit_index[q] for q in instruction.qubits),
+                tuple(clbit_index[c] for c in instruction.clbits),
+            )
+            for instruction in circuit.data
+        )
+        
+        registers = tuple((reg.name, reg.size) for reg in circuit.qregs + circuit.cregs)
+        return (circuit.num_qubits, circuit.num_clbits, registers, instructions)
+    
+    def _compile_circuit(self, circuit: QuantumCircuit, simulator: AerSimulator) -> QuantumCircuit:
+        """Transpile circuit untuk simulator, memakai cache LRU agar tidak diulang"""
+        # Circuit yang hanya berisi gate native Aer tidak perlu di-transpile
+        if AER_NATIVE_GATES.issuperset(circuit.count_ops()):
+            return circuit
+        
+        key = (self._circuit_key(circuit), simulator.name)
+        
+        compiled_circuit = self._transpile_cache.get(key)
+        if compiled_circuit is not None:
+            self._transpile_cache.move_to_end(key)
+            return compiled_circuit
+        
+        compiled_circuit = transpile(circuit, simulator, optimization_level=0)
+        self._transpile_cache[key] = compiled_circuit
+        if len(self._transpile_cache) > TRANSPILE_CACHE_SIZE:
+            self._transpile_cache.popitem(last=False)
+        
+        return compiled_circuit
+    
+    @staticmethod
+    def _has_only_final_measurements(circuit: QuantumCircuit) -> bool:
+        """
+        True jika circuit hanya berisi gate unitary, opsional diikuti measurement
+        di akhir (tanpa measurement di tengah, kontrol klasik, atau reset)
+        """
+        measured = False
+        for instruction in circuit.data:
+            name = instruction.operation.name
+            if name == 'barrier':
+                continue
+            if name == 'measure':
+                measured = True
+                continue
+            if measured or not isinstance(instruction.operation, Gate):
+                return False
+        return True
+    
+    @staticmethod
+    def _final_measurement_map(circuit: QuantumCircuit) -> Optional[Dict[int, int]]:
+        """
+        Mapping clbit -> qubit jika circuit hanya berisi gate unitary diikuti
+        measurement di akhir; None jika ada measurement di tengah, kontrol klasik,
+        reset, atau lebih dari satu classical register
+        """
+        if len(circuit.cregs) != 1:
+            return None
+        
+        measurement_map: Dict[int, int] = {}
+        for instruction in circuit.data:
+            name = instruction.operation.name
+            if name == 'barrier':
+                continue
+            if name == 'measure':
+                clbit = circuit.find_bit(instruction.clbits[0]).index
+                qubit = circuit.find_bit(instruction.qubits[0]).index
+                # Qubit yang diukur lebih dari sekali, atau clbit yang ditimpa, ditangani Aer
+                if clbit in measurement_map or qubit in measurement_map.values():
+                    return None
+                measurement_map[clbit] = qubit
+                continue
+            if measurement_map or not isinstance(instruction.operation, Gate):
+                return None
+        
+        return measurement_map or None
+    
+    def _sample_counts(self, statevector: Statevector, measurement_map: Dict[int, int],
+                       n_clbits: int, shots: int) -> Dict:
+        """Sampling counts secara multinomial dari probabilitas statevector"""
+        clbits = sorted(measurement_map)
+        qargs = [measurement_map[c] for c in clbits]
+        
+        probabilities = statevector.probabilities(qargs)
+        outcomes = self._rng.multinomial(shots, probabilities / probabilities.sum())
+        
+        # Bit ke-j dari indeks outcome = clbit clbits[j] (clbit 0 paling kanan, seperti Aer)
+        counts: Dict[str, int] = {}
+        for index in np.flatnonzero(outcomes):
+            bits = {c: (index >> j) & 1 for j, c in enumerate(clbits)}
+            state = ''.join(str(bits.get(c, 0)) for c in reversed(range(n_clbits)))
+            counts[state] = int(outcomes[index])
+        
+        return counts
+    
+    @staticmethod
+    def _with_saved_statevector(circuit: QuantumCircuit) -> QuantumCircuit:
+        """Salinan circuit dengan save_statevector tepat sebelum measurement akhir"""
+        circuit_copy = circuit.copy_empty_like()
+        saved = False
+        for instruction in circuit.data:
+            if instruction.operation.name == 'measure' and not saved:
+                circuit_copy.save_statevector()
+                saved = True
+            circuit_copy.append(instruction.operation, instruction.qubits, instruction.clbits)
+        return circuit_copy
+    
+    def _cache_statevector(self, key: Tuple, statevector: Statevector):
+        """Simpan statevector ke cache LRU, dibatasi total ukuran memori"""
+        n_bytes = statevector.data.nbytes
+        if n_bytes > STATEVECTOR_CACHE_BYTES:
+            return
+        
+        previous = self._statevector_cache.pop(key, None)
+        if previous is not None:
+            self._statevector_cache_bytes -= previous.data.nbytes
+        
+        self._statevector_cache[key] = statevector
+        self._statevector_cache_bytes += n_bytes
+        while self._statevector_cache_bytes > STATEVECTOR_CACHE_BYTES:
+            _, evicted = self._statevector_cache.popitem(last=False)
+            self._statevector_cache_bytes -= evicted.data.nbytes
+    
     def execute_circuit(self, circuit: QuantumCircuit, shots: int = 1024) -> Dict:
-        """Eksekusi circuit dan return hasil"""
+        """
+        Eksekusi circuit dan return hasil
+        Circuit kecil dengan measurement di akhir saja juga menyimpan statevector
+        saat dijalankan; eksekusi berikutnya cukup sampling ulang dari cache
+        """
         start_time = time.time()
         
-        compiled_circuit = transpile(circuit, self.simulator)
-        job = self.simulator.run(compiled_circuit, shots=shots)
-        result = job.result()
-        counts = result.get_counts()
+        simulator = self._select_simulator(circuit)
+        measurement_map = None
+        # Hanya backend statevector CPU: circuit GPU tetap disampling oleh cuStateVec
+        if simulator is self.simulator and circuit.num_qubits <= RESAMPLE_MAX_QUBITS:
+            measurement_map = self._final_measurement_map(circuit)
+        
+        statevector = None
+        if measurement_map:
+            key = (self._circuit_key(circuit), simulator.name)
+            statevector = self._statevector_cache.get(key)
+        
+        if statevector is not None:
+            self._statevector_cache.move_to_end(key)
+            counts = self._sample_counts(statevector, measurement_map,
+                                         circuit.num_clbits, shots)
+        else:
+            run_circuit = circuit
+            if measurement_map:
+                run_circuit = self._with_saved_statevector(circuit)
+            compiled_circuit = self._compile_circuit(run_circuit, simulator)
+            job = simulator.run(compiled_circuit, shots=shots)
+            result = job.result()
+            counts = result.get_counts(0)
+            if measurement_map:
+                self._cache_statevector(key, result.get_statevector(0))
         
         execution_time = time.time() - start_time
         
@@ -275,23 +563,261 @@ class AdvancedQuantumApp:
         
         return counts
     
-    def analyze_entanglement(self, circuit: QuantumCircuit) -> float:
-        """Analisis tingkat entanglement menggunakan entropy"""
-        statevector = Statevector.from_instruction(circuit.remove_final_measurements(inplace=False))
-        density_matrix = DensityMatrix(statevector)
+    def _run_batch(self, circuits: List[QuantumCircuit], shots: int) -> Tuple[List[Dict], List[float]]:
+        """Jalankan circuit di Aer, satu job per backend; return counts dan waktu eksekusi"""
+        groups: Dict[str, Tuple[AerSimulator, List[int]]] = {}
+        for index, circuit in enumerate(circuits):
+            simulator = self._select_simulator(circuit)
+            groups.setdefault(simulator.name, (simulator, []))[1].append(index)
+        
+        all_counts = [None] * len(circuits)
+        execution_times = [0.0] * len(circuits)
+        for simulator, indices in groups.values():
+            compiled_circuits = [self._compile_circuit(circuits[i], simulator) for i in indices]
+            result = simulator.run(compiled_circuits, shots=shots).result()
+            for position, index in enumerate(indices):
+                all_counts[index] = result.get_counts(position)
+                execution_times[index] = result.results[position].time_taken
+        
+        return all_counts, execution_times
+    
+    def _record_results(self, circuits: List[QuantumCircuit], all_counts: List[Dict],
+                        execution_times: List[float], shots: int,
+                        timings: Optional[List[str]] = None):
+        """
+        Simpan hasil eksekusi batch ke results_history sesuai urutan circuit
+        `timings` (opsional) menandai arti execution_time tiap entri
+        """
+        for index, (circuit, counts, execution_time) in enumerate(
+                zip(circuits, all_counts, execution_times)):
+            record = {
+                'circuit': circuit.name,
+                'counts': counts,
+                'shots': shots,
+                'execution_time': execution_time
+            }
+            if timings is not None:
+                record['timing'] = timings[index]
+            self.results_history.append(record)
+    
+    def execute_circuits(self, circuits: List[QuantumCircuit], shots: int = 1024) -> List[Dict]:
+        """Eksekusi beberapa circuit sekaligus dalam satu job per backend"""
+        all_counts, execution_times = self._run_batch(circuits, shots)
+        self._record_results(circuits, all_counts, execution_times, shots)
+        
+        return all_counts
+    
+    def _to_cudaq_kernel(self, circuit: QuantumCircuit):
+        """
+        Terjemahkan QuantumCircuit menjadi kernel CUDA-Q (gate demi gate)
+        Return kernel dan mapping clbit -> qubit yang diukur.
+        ValueError jika circuit memakai operasi yang tidak didukung
+        (measurement di tengah circuit, kontrol klasik, dll)
+        """
+        import cudaq # type: ignore
+        
+        flat_circuit = transpile(circuit, basis_gates=list(CUDAQ_BASIS_GATES),
+                                 optimization_level=0)
+        kernel = cudaq.make_kernel()
+        qubits = kernel.qalloc(flat_circuit.num_qubits)
+        
+        measured: Dict[int, int] = {}
+        for instruction in flat_circuit.data:
+            name = instruction.operation.name
+            params = instruction.operation.params
+            q = [qubits[flat_circuit.find_bit(bit).index] for bit in instruction.qubits]
+            
+            if name == 'barrier':
+                continue
+            if name == 'measure':
+                clbit = flat_circuit.find_bit(instruction.clbits[0]).index
+                measured[clbit] = flat_circuit.find_bit(instruction.qubits[0]).index
+                continue
+            if measured:
+                raise ValueError(f"Gate '{name}' setelah measurement tidak didukung CUDA-Q")
+            
+            if name in ('h', 'x', 'y', 'z', 's', 't'):
+                getattr(kernel, name)(q[0])
+            elif name in ('rx', 'ry', 'rz'):
+                getattr(kernel, name)(float(params[0]), q[0])
+            elif name in ('cx', 'cz'):
+                getattr(kernel, name)(q[0], q[1])
+            elif name == 'cp':
+                kernel.cr1(float(params[0]), q[0], q[1])
+            elif name == 'ccx':
+                kernel.cx([q[0], q[1]], q[2])
+            elif name == 'swap':
+                kernel.swap(q[0], q[1])
+            else:
+                raise ValueError(f"Operasi '{name}' tidak didukung CUDA-Q")
+        
+        kernel.mz(qubits)
+        return kernel, measured
+    
+    def execute_circuits_mqpu(self, circuits: List[QuantumCircuit], shots: int = 1024) -> List[Dict]:
+        """
+        Eksekusi circuit secara paralel di beberapa virtual QPU (CUDA-Q nvidia-mqpu)
+        Circuit yang tidak bisa diterjemahkan, atau jika CUDA-Q/GPU tidak tersedia,
+        dijalankan dengan Aer
+        """
+        try:
+            import cudaq # type: ignore
+            cudaq.set_target('nvidia', option='mqpu')
+        except (ImportError, RuntimeError):
+            return self.execute_circuits(circuits, shots=shots)
         
+        num_qpus = cudaq.get_target().num_qpus()
+        start_time = time.time()
         
-        return entropy(density_matrix, base=2)
+        futures = []
+        aer_indices = []
+        for index, circuit in enumerate(circuits):
+            try:
+                kernel, measured = self._to_cudaq_kernel(circuit)
+            except ValueError:
+                aer_indices.append(index)
+                continue
+            qpu_id = len(futures) % num_qpus
+            future = cudaq.sample_async(kernel, shots_count=shots, qpu_id=qpu_id)
+            futures.append((index, measured, future))
+        
+        all_counts = [None] * len(circuits)
+        execution_times = [0.0] * len(circuits)
+        # 'aer_experiment': time_taken Aer per circuit; 'mqpu_batch': wall time seluruh batch CUDA-Q
+        timings = ['mqpu_batch'] * len(circuits)
+        
+        if aer_indices:
+            aer_counts, aer_times = self._run_batch([circuits[i] for i in aer_indices], shots)
+            for index, counts, execution_time in zip(aer_indices, aer_counts, aer_times):
+                all_counts[index] = counts
+                execution_times[index] = execution_time
+                timings[index] = 'aer_experiment'
+        
+        for index, measured, future in futures:
+            n_clbits = circuits[index].num_clbits
+            counts: Dict[str, int] = {}
+            for bits, count in future.get().items():
+                # CUDA-Q: qubit 0 paling kiri; Qiskit: clbit 0 paling kanan
+                key = ''.join(bits[measured[c]] if c in measured else '0'
+                              for c in reversed(range(n_clbits)))
+                counts[key] = counts.get(key, 0) + count
+            all_counts[index] = counts
+        
+        # Sampling berjalan paralel di beberapa QPU, jadi waktu per circuit tidak
+        # terpisahkan; semua circuit CUDA-Q mencatat waktu batch yang sama
+        batch_time = time.time() - start_time
+        for index, _, _ in futures:
+            execution_times[index] = batch_time
+        
+        self._record_results(circuits, all_counts, execution_times, shots, timings)
+        return all_counts
+    
+    def _simulate_statevector(self, circuit: QuantumCircuit) -> Statevector:
+        """
+        Simulasi statevector akhir circuit (tanpa measurement) menggunakan Aer
+        Backend statevector CPU/GPU dipilih lewat _select_simulator dan hasilnya
+        di-cache (LRU) untuk resampling maupun analisis entanglement
+        """
+        # Setelah measurement di tengah / kontrol klasik, statevector hanya satu cabang acak
+        if not self._has_only_final_measurements(circuit):
+            raise ValueError("Statevector hanya didukung untuk circuit unitary "
+                             "dengan measurement di akhir")
+        
+        # Metode stabilizer tidak menghasilkan statevector
+        simulator = self._select_simulator(circuit)
+        if simulator is self.stabilizer_simulator:
+            simulator = self.simulator
+        
+        key = (self._circuit_key(circuit), simulator.name)
+        statevector = self._statevector_cache.get(key)
+        if statevector is not None:
+            self._statevector_cache.move_to_end(key)
+            return statevector
+        
+        circuit_copy = circuit.remove_final_measurements(inplace=False)
+        circuit_copy.save_statevector()
+        
+        compiled_circuit = self._compile_circuit(circuit_copy, simulator)
+        result = simulator.run(compiled_circuit).result()
+        statevector = result.get_statevector(0)
+        
+        self._cache_statevector(key, statevector)
+        
+        return statevector
+    
+    def analyze_entanglement(self, circuit: QuantumCircuit,
+                             qargs: Optional[List[int]] = None) -> float:
+        """
+        Analisis tingkat entanglement menggunakan entropy
+        Entropy Von Neumann dari reduced state subsistem `qargs`
+        (default: setengah qubit pertama)
+        """
+        statevector = self._simulate_statevector(circuit)
+        
+        n_qubits = circuit.num_qubits
+        if qargs is None:
+            qargs = list(range(n_qubits // 2))
+        traced_qargs = [q for q in range(n_qubits) if q not in qargs]
+        
+        # partial_trace langsung dari statevector, tanpa density matrix penuh 2^n x 2^n
+        reduced_state = partial_trace(statevector, traced_qargs)
+        
+        return entropy(reduced_state, base=2)
+    
+    @staticmethod
+    def _top_counts(counts: Dict, k: int = 5) -> Dict:
+        """Ambil k hasil terbanyak dengan partial selection NumPy (O(N))"""
+        states = np.array(list(counts.keys()))
+        values = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+        
+        if len(values) > k:
+            top_indices = np.argpartition(-values, k)[:k]
+        else:
+            top_indices = np.arange(len(values))
+        top_indices = top_indices[np.argsort(-values[top_indices], kind='stable')]
+        
+        return {str(states[i]): int(values[i]) for i in top_indices}
+    
+    def circuit_diagram(self, circuit: QuantumCircuit) -> str:
+        """
+        Diagram teks circuit, di-cache (LRU) supaya tidak digambar ulang
+        Key: id(circuit), divalidasi dengan weakref dan jumlah instruksi
+        """
+        key = id(circuit)
+        
+        entry = self._diagram_cache.get(key)
+        if entry is not None:
+            circuit_ref, n_ops, diagram = entry
+            if circuit_ref() is circuit and n_ops == len(circuit.data):
+                self._diagram_cache.move_to_end(key)
+                return diagram
+        
+        diagram = str(circuit.draw(output='text', fold=-1))
+        self._diagram_cache[key] = (weakref.ref(circuit), len(circuit.data), diagram)
+        self._diagram_cache.move_to_end(key)
+        if len(self._diagram_cache) > DIAGRAM_CACHE_SIZE:
+            self._diagram_cache.popitem(last=False)
+        
+        return diagram
     
     def visualize_results(self, counts: Dict, title: str = "Quantum Results"):
         """Visualisasi hasil pengukuran"""
-        plt.figure(figsize=(12, 6))
-        plot_histogram(counts, title=title, figsize=(12, 6), color='#FF6B6B')
-        plt.tight_layout()
+        # Import visualisasi ditunda sampai dibutuhkan agar import modul tetap ringan
+        import matplotlib.pyplot as plt # type: ignore
+        from qiskit.visualization import plot_histogram # type: ignore
+        
+        fig = plot_histogram(counts, title=title, figsize=(12, 6), color='#FF6B6B')
+        fig.tight_layout()
         plt.show()
+        # Tutup figure agar memori canvas tidak menumpuk selama demo
+        plt.close(fig)
     
-    def run_comprehensive_demo(self):
-        """Menjalankan demo komprehensif semua algoritma"""
+    def run_comprehensive_demo(self, verbose: bool = True, use_mqpu: bool = False):
+        """
+        Menjalankan demo komprehensif semua algoritma
+        verbose=False melewati penggambaran diagram circuit,
+        use_mqpu=True menjalankan demo paralel di CUDA-Q nvidia-mqpu
+        """
         print("=" * 80)
         print("🌌 ADVANCED QUANTUM COMPUTING APPLICATION")
         print("=" * 80)
@@ -307,21 +833,29 @@ class AdvancedQuantumApp:
             ("Quantum Error Correction", self.quantum_error_correction())
         ]
         
-        for name, circuit in demos:
+        # Semua demo dijalankan dalam satu batch
+        start_time = time.time()
+        circuits = [circuit for _, circuit in demos]
+        if use_mqpu:
+            all_counts = self.execute_circuits_mqpu(circuits, shots=2048)
+        else:
+            all_counts = self.execute_circuits(circuits, shots=2048)
+        batch_time = time.time() - start_time
+        records = self.results_history[-len(demos):]
+        
+        for (name, circuit), counts, record in zip(demos, all_counts, records):
             print(f"\n{'=' * 80}")
             print(f"🔬 Running: {name}")
             print(f"{'=' * 80}")
             
           
-            print(f"\n Circuit Diagram:")
-            print(circuit.draw(output='text'))
-            
-            # Eksekusi
-            counts = self.execute_circuit(circuit, shots=2048)
+            if verbose:
+                print(f"\n Circuit Diagram:")
+                print(self.circuit_diagram(circuit))
             
             # Analisis
             print(f"\n Results:")
-            sorted_counts = dict(sorted(counts.items(), key=lambda x: x[1], reverse=True)[:5])
+            sorted_counts = self._top_counts(counts, k=5)
             for state, count in sorted_counts.items():
                 probability = (count / 2048) * 100
                 print(f"   |{state}⟩: {count} times ({probability:.2f}%)")
@@ -329,8 +863,9 @@ class AdvancedQuantumApp:
          
             self.visualize_results(counts, title=name)
             
-            print(f"\n  Execution time: {self.results_history[-1]['execution_time']:.4f} seconds")
+            print(f"\n  Execution time: {record['execution_time']:.4f} seconds")
         
+        print(f"\n  Total batch execution time: {batch_time:.4f} seconds")
         print(f"\n{'=' * 80}")
         print("All quantum algorithms executed successfully!")
         print(f"{'=' * 80}")
@@ -354,7 +889,7 @@ if __name__ == "__main__":
     custom_circuit.measure([0, 1, 2], [0, 1, 2])
     
     print("\nCustom GHZ State Circuit:")
-    print(custom_circuit.draw(output='text'))
+    print(app.circuit_diagram(custom_circuit))
     
     results = app.execute_circuit(custom_circuit, shots=4096)
     app.visualize_results(results, title="Custom GHZ State")